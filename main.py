@@ -1,22 +1,125 @@
 import os
 import shutil
+import argparse
+import asyncio
+import time
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict
-import hashlib
+from typing import List, Dict, Tuple, Optional, Callable, Awaitable
+from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor
 import json
 from abc import ABC, abstractmethod
 
-from openai import OpenAI
+import aiofiles
+import blake3
+import tiktoken
+import httpx
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient, RateLimitError, APIConnectionError, InternalServerError
+from google.api_core import exceptions as google_exceptions
 import google.generativeai as genai
+try:
+    import orjson
+except ImportError:  # Optional speedup, see the "speedups" extra
+    orjson = None
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:  # Only needed for --watch, see the "watch" extra
+    FileSystemEventHandler = object
+    Observer = None
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_random_exponential
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
 from rich.text import Text
+from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TimeElapsedColumn, TaskID
 
 
 console = Console()
 
+# Characters that are not allowed in file names, removed in a single translate pass
+_SANITIZE_TABLE = str.maketrans('', '', '<>:"/\\|?*')
+
+PROCESSED_INDEX_FILENAME = ".processed_index.json"
+# Digests are stored as "<algorithm>:<hex>" so the algorithm can change without
+# mistaking old digests for new ones
+HASH_ALGORITHM = "blake3"
+WATCH_SETTLE_SECONDS = 10
+WATCH_RETRY_INITIAL_DELAY = 60
+WATCH_RETRY_MAX_DELAY = 3600
+BATCH_POLL_INITIAL_DELAY = 10
+BATCH_POLL_MAX_DELAY = 600
+
+
+def _int_env(name: str, default: int) -> int:
+    value = os.environ.get(name)
+    if not value:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        raise ValueError(f"{name} '{value}' must be an integer")
+
+
+def _json_loads(data: str):
+    # orjson parses large (batched) responses several times faster than json
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def _batch_error(record: Dict) -> str:
+    # HTTP-level failures carry their details in the response body; the top-level
+    # error is only set when the request never got a response
+    response = record.get("response") or {}
+    body = response.get("body")
+    error = (body.get("error") if isinstance(body, dict) else None) or record.get("error") or {}
+    if isinstance(error, dict):
+        return error.get("message") or f"status {response.get('status_code')}"
+    return str(error)
+
+
+def _log_retry(retry_state):
+    console.print(f"[yellow]Warning:[/yellow] {retry_state.fn.__name__} failed "
+                  f"({retry_state.outcome.exception()}), retrying in {retry_state.next_action.sleep:.0f}s...")
+
+
+def _api_retry(*exception_types):
+    # Transient errors (rate limits, connection problems, 5xx) are retried with
+    # jittered exponential backoff instead of failing the memo
+    return retry(
+        wait=wait_random_exponential(min=1, max=60),
+        stop=stop_after_attempt(5),
+        retry=retry_if_exception_type(exception_types),
+        before_sleep=_log_retry,
+        reraise=True
+    )
+
+
+openai_retry = _api_retry(RateLimitError, APIConnectionError, InternalServerError)
+gemini_retry = _api_retry(
+    google_exceptions.ResourceExhausted,
+    google_exceptions.ServiceUnavailable,
+    google_exceptions.InternalServerError,
+    google_exceptions.DeadlineExceeded
+)
+
+
+def _estimate_tokens(text: str) -> int:
+    # Rough heuristic (~4 characters per token), good enough for throttling
+    return len(text) // 4 + 1
+
+
+def _load_encoding(model: str) -> Optional[tiktoken.Encoding]:
+    try:
+        try:
+            return tiktoken.encoding_for_model(model)
+        except KeyError:
+            return tiktoken.get_encoding("o200k_base")
+    except Exception as e:
+        # tiktoken downloads its encodings on first use, which can fail offline
+        console.print(f"[yellow]Warning:[/yellow] Could not load tokenizer, estimating token counts: {e}")
+        return None
+
 
 class Config:
     def __init__(self):
@@ -34,6 +137,11 @@ class Config:
         self.notes_folder = os.environ.get("OBSIDIAN_NOTES_FOLDER", "notes/memos")
         self.voice_memos_path = Path(os.environ.get("VOICE_MEMOS_PATH", "/Users/guistiebler/Library/Group Containers/group.com.apple.VoiceMemos.shared/Recordings"))
         
+        # Resolved once here since they are used several times per memo
+        self.attachments_path = self.obsidian_vault_path / self.attachments_folder
+        self.diary_path = self.obsidian_vault_path / self.diary_folder
+        self.notes_path = self.obsidian_vault_path / self.notes_folder
+        
         # Model configuration
         if self.api_provider == "openai":
             self.whisper_model = os.environ.get("OPENAI_WHISPER_MODEL", "whisper-1")
@@ -54,6 +162,15 @@ class Config:
         else:
             self.process_after_date = None
         
+        # Concurrency and rate limiting
+        self.transcription_workers = _int_env("TRANSCRIPTION_WORKERS", 8)
+        self.summary_workers = _int_env("SUMMARY_WORKERS", 8)
+        self.summary_batch_size = _int_env("SUMMARY_BATCH_SIZE", 10)
+        self.summary_batch_max_tokens = _int_env("SUMMARY_BATCH_MAX_TOKENS", 8000)
+        self.max_requests_per_minute = _int_env("MAX_REQUESTS_PER_MINUTE", 500)
+        self.max_tokens_per_minute = _int_env("MAX_TOKENS_PER_MINUTE", 200000)
+        self.watch_quiet_seconds = _int_env("WATCH_QUIET_SECONDS", 120)
+        
         # Validate configuration
         if self.api_provider == "openai" and not self.openai_api_key:
             raise ValueError("OPENAI_API_KEY environment variable is not set")
@@ -63,23 +180,101 @@ class Config:
             raise ValueError(f"OBSIDIAN_VAULT_PATH '{self.obsidian_vault_path}' does not exist")
         if not self.voice_memos_path.exists():
             raise ValueError(f"Voice memos path '{self.voice_memos_path}' does not exist")
+        if self.transcription_workers < 1 or self.summary_workers < 1:
+            raise ValueError("TRANSCRIPTION_WORKERS and SUMMARY_WORKERS must be at least 1")
+        if self.summary_batch_size < 1 or self.summary_batch_max_tokens < 1:
+            raise ValueError("SUMMARY_BATCH_SIZE and SUMMARY_BATCH_MAX_TOKENS must be at least 1")
+        if self.max_requests_per_minute < 1 or self.max_tokens_per_minute < 1:
+            raise ValueError("MAX_REQUESTS_PER_MINUTE and MAX_TOKENS_PER_MINUTE must be at least 1")
+
+
+class _VoiceMemoEventHandler(FileSystemEventHandler):
+    """Forwards file system events from the watchdog thread to the event loop."""
+    
+    def __init__(self, loop: asyncio.AbstractEventLoop, on_change: Callable[[str], None]):
+        super().__init__()
+        self.loop = loop
+        self.on_change = on_change
+    
+    def on_any_event(self, event):
+        # Ignore open/close events, which our own hashing of the memos triggers
+        if event.is_directory or event.event_type not in ("created", "modified", "moved", "deleted"):
+            return
+        for path in (event.src_path, getattr(event, "dest_path", "")):
+            if path:
+                self.loop.call_soon_threadsafe(self.on_change, os.fsdecode(path))
+
+
+@dataclass
+class MemoJob:
+    """A voice memo moving through the transcribe -> summarize -> write pipeline."""
+    memo_file: Path
+    file_hash: str
+    stat: os.stat_result
+    task_id: Optional[TaskID] = None
+    transcription: str = ""
+    summary_data: Dict[str, str] = field(default_factory=dict)
+
+
+class RateLimiter:
+    """Throttles API calls to stay under per-minute request and token limits.
+
+    Capacity refills continuously, following the approach of OpenAI's
+    api_request_parallel_processor cookbook example.
+    """
     
-    @property
-    def attachments_path(self) -> Path:
-        return self.obsidian_vault_path / self.attachments_folder
+    def __init__(self, max_requests_per_minute: int, max_tokens_per_minute: int):
+        self.max_requests_per_minute = max_requests_per_minute
+        self.max_tokens_per_minute = max_tokens_per_minute
+        self.available_request_capacity = float(max_requests_per_minute)
+        self.available_token_capacity = float(max_tokens_per_minute)
+        self.last_update_time = time.monotonic()
+        self._lock = asyncio.Lock()
     
-    @property
-    def diary_path(self) -> Path:
-        return self.obsidian_vault_path / self.diary_folder
+    def _refill(self):
+        now = time.monotonic()
+        elapsed = now - self.last_update_time
+        self.available_request_capacity = min(
+            self.available_request_capacity + self.max_requests_per_minute * elapsed / 60.0,
+            self.max_requests_per_minute
+        )
+        self.available_token_capacity = min(
+            self.available_token_capacity + self.max_tokens_per_minute * elapsed / 60.0,
+            self.max_tokens_per_minute
+        )
+        self.last_update_time = now
     
-    @property
-    def notes_path(self) -> Path:
-        return self.obsidian_vault_path / self.notes_folder
+    async def acquire(self, token_count: int = 0):
+        # A single request can never need more than a full minute of tokens
+        token_count = min(token_count, self.max_tokens_per_minute)
+        async with self._lock:
+            while True:
+                self._refill()
+                if self.available_request_capacity >= 1 and self.available_token_capacity >= token_count:
+                    self.available_request_capacity -= 1
+                    self.available_token_capacity -= token_count
+                    return
+                await asyncio.sleep(0.1)
 
 
 class BaseMemoProcessor(ABC):
+    # Providers that implement generate_summaries_with_batch_api (needed for --batch)
+    supports_batch_api = False
+    # Providers whose generate_summary_and_title_batch packs several transcriptions
+    # into one request; only they are handed more than one memo at a time
+    packs_summaries = False
+    
     def __init__(self, config: Config):
         self.config = config
+        self.rate_limiter = RateLimiter(config.max_requests_per_minute, config.max_tokens_per_minute)
+        self._daily_notes_with_header: set[Path] = set()
+        self._progress: Optional[Progress] = None
+        self._voice_memos: Optional[Dict[str, os.stat_result]] = None
+        self._next_recheck: Optional[float] = None
+        # Source keys of memos that failed or transcribed empty, mapped to the number
+        # of failures and when to retry (None: not until the memo changes). Only kept
+        # in --watch mode so a long-running watcher doesn't re-upload them on every pass.
+        self._failed_sources: Optional[Dict[str, Tuple[int, Optional[float]]]] = None
         self._ensure_folders_exist()
         self._load_processed_files()
     
@@ -91,78 +286,266 @@ class BaseMemoProcessor(ABC):
     def _load_processed_files(self):
         # Build hash set from existing files in attachments folder
         self.processed_files = set()
+        self._index_path = self.config.attachments_path / PROCESSED_INDEX_FILENAME
+        cached = self._read_processed_index()
+        cached_index = cached.get("files", {})
+        self._processed_index: Dict[str, Dict] = {}
+        self._index_dirty = False
+        rehashed = 0
         
-        # Scan all audio files in the attachments folder
+        # Scan all audio files in the attachments folder, only hashing files
+        # whose size or modification time changed since the last run
         if self.config.attachments_path.exists():
-            with console.status("[bold green]Scanning existing audio files...", spinner="dots"):
-                for audio_file in self.config.attachments_path.glob("*.m4a"):
-                    try:
-                        file_hash = self._get_file_hash(audio_file)
-                        self.processed_files.add(file_hash)
-                    except Exception as e:
-                        console.print(f"[yellow]Warning:[/yellow] Could not hash {audio_file.name}: {e}")
+            stale = []
+            with os.scandir(self.config.attachments_path) as entries:
+                for entry in entries:
+                    if not entry.name.endswith(".m4a") or not entry.is_file():
+                        continue
+                    file_key = os.path.abspath(entry.path)
+                    stat = entry.stat()
+                    record = cached_index.get(file_key)
+                    if (record is None or not record.get("digest", "").startswith(f"{HASH_ALGORITHM}:")
+                            or record.get("size") != stat.st_size
+                            or record.get("mtime") != stat.st_mtime_ns):
+                        stale.append((file_key, stat))
+                        continue
+                    self._processed_index[file_key] = record
+                    self.processed_files.add(record["digest"])
+            
+            # Hashing releases the GIL, so changed files are hashed in parallel
+            def try_hash(file_key: str) -> Optional[str]:
+                try:
+                    return self._get_file_hash(Path(file_key))
+                except Exception as e:
+                    console.print(f"[yellow]Warning:[/yellow] Could not hash {os.path.basename(file_key)}: {e}")
+                    return None
+            
+            if stale:
+                with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+                    digests = executor.map(try_hash, [file_key for file_key, _ in stale])
+                    for (file_key, stat), digest in zip(stale, digests):
+                        if digest is None:
+                            continue
+                        self._processed_index[file_key] = {"size": stat.st_size, "mtime": stat.st_mtime_ns,
+                                                           "digest": digest}
+                        self.processed_files.add(digest)
+                        rehashed += 1
+        
+        # Source memos seen before, keyed by "size:mtime_ns", so unchanged memos
+        # can be skipped without hashing. Entries whose attachment is gone are
+        # dropped so those memos get processed again.
+        cached_sources = cached.get("sources", {})
+        self._source_index: Dict[str, str] = {
+            key: digest for key, digest in cached_sources.items() if digest in self.processed_files
+        }
+        
+        if rehashed or len(self._processed_index) != len(cached_index) or len(self._source_index) != len(cached_sources):
+            self._index_dirty = True
+            self._save_processed_index()
         
-        console.print(f"[green]✓[/green] Found [bold]{len(self.processed_files)}[/bold] existing audio files in attachments folder")
+        console.print(f"[green]✓[/green] Found [bold]{len(self.processed_files)}[/bold] existing audio files in attachments folder"
+                      + (f" [dim]({rehashed} rehashed)[/dim]" if rehashed else ""))
+    
+    def _read_processed_index(self) -> Dict[str, Dict]:
+        try:
+            with open(self._index_path, 'r', encoding='utf-8') as f:
+                index = json.load(f)
+            if not isinstance(index, dict):
+                raise ValueError("index is not a JSON object")
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            console.print(f"[yellow]Warning:[/yellow] Ignoring unreadable {self._index_path.name}: {e}")
+            return {}
+        
+        # The file may have been edited by hand, so entries of the wrong shape are
+        # dropped (and rehashed) instead of failing startup
+        files = index.get("files")
+        sources = index.get("sources")
+        return {
+            "files": {
+                key: record for key, record in files.items()
+                if isinstance(record, dict) and isinstance(record.get("digest"), str)
+            } if isinstance(files, dict) else {},
+            "sources": {
+                key: digest for key, digest in sources.items() if isinstance(digest, str)
+            } if isinstance(sources, dict) else {},
+        }
+    
+    def _save_processed_index(self):
+        if not self._index_dirty:
+            return
+        # Write to a temporary file first so an interrupted run never leaves a truncated index
+        tmp_path = self._index_path.with_name(self._index_path.name + ".tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({"files": self._processed_index, "sources": self._source_index}, f)
+        os.replace(tmp_path, self._index_path)
+        self._index_dirty = False
+    
+    def _source_key(self, stat: os.stat_result) -> str:
+        return f"{stat.st_size}:{stat.st_mtime_ns}"
+    
+    def _record_processed(self, memo_stat: os.stat_result, audio_file: Path, file_hash: str):
+        # copy2 preserves size and mtime, so the memo's stat describes the copy too
+        self._processed_index[os.path.abspath(audio_file)] = {
+            "size": memo_stat.st_size, "mtime": memo_stat.st_mtime_ns, "digest": file_hash
+        }
+        self._source_index[self._source_key(memo_stat)] = file_hash
+        self.processed_files.add(file_hash)
+        self._index_dirty = True
     
     def _get_file_hash(self, file_path: Path) -> str:
-        with open(file_path, 'rb') as f:
-            return hashlib.md5(f.read()).hexdigest()
+        # The hash is only a dedupe key, so use the much faster BLAKE3; update_mmap
+        # hashes straight from the page cache using multiple threads
+        hasher = blake3.blake3(max_threads=blake3.blake3.AUTO)
+        hasher.update_mmap(str(file_path))
+        return f"{HASH_ALGORITHM}:{hasher.hexdigest()}"
+    
+    def _list_voice_memos(self) -> Dict[str, os.stat_result]:
+        # The folder may live on a slow (iCloud/network) filesystem, so it is listed
+        # once per processor; in --watch mode the watcher keeps the listing current.
+        # scandir returns the stat info with the directory listing, so filtering
+        # by date costs no extra syscall per file.
+        if self._voice_memos is None:
+            self._voice_memos = {}
+            with os.scandir(self.config.voice_memos_path) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".m4a") and entry.is_file(follow_symlinks=False):
+                        self._voice_memos[entry.path] = entry.stat()
+        return self._voice_memos
     
-    def get_unprocessed_memos(self) -> List[Path]:
-        memo_files = list(self.config.voice_memos_path.glob("*.m4a"))
+    def _voice_memo_changed(self, path: str) -> bool:
+        # Called on the event loop by the watcher for every file event in the folder;
+        # returns whether it was a memo, so writes to Voice Memos' own database don't
+        # trigger a pass
+        if self._voice_memos is None or not path.endswith(".m4a"):
+            return False
+        try:
+            self._voice_memos[path] = os.stat(path)
+        except FileNotFoundError:
+            self._voice_memos.pop(path, None)
+        return True
+    
+    def get_unprocessed_memos(self, min_age: float = 0) -> List[Tuple[Path, str, os.stat_result]]:
         unprocessed = []
+        deferred = 0
+        failed = 0
+        self._next_recheck = None
+        voice_memos = self._list_voice_memos()
         
-        with console.status("[bold green]Filtering voice memos...", spinner="dots"):
-            for memo_file in memo_files:
-                # Check date filter first
-                if self.config.process_after_date:
-                    creation_date = self.get_file_creation_date(memo_file)
-                    if creation_date < self.config.process_after_date:
-                        continue  # Skip files created before the cutoff date
-                
-                # Check if already processed
+        for path, stat in list(voice_memos.items()):
+            # Check date filter first
+            if self.config.process_after_date:
+                creation_date = self._creation_date_from_stat(stat)
+                if creation_date < self.config.process_after_date:
+                    continue  # Skip files created before the cutoff date
+            
+            # Unchanged memos that were already processed are known by their stat alone
+            source_key = self._source_key(stat)
+            if self._source_index.get(source_key) in self.processed_files:
+                continue
+            
+            # Memos that failed earlier this session are retried with backoff; empty
+            # transcriptions would come back empty again, so they wait until they change
+            if self._failed_sources is not None and source_key in self._failed_sources:
+                _, retry_at = self._failed_sources[source_key]
+                if retry_at is None or retry_at > time.time():
+                    failed += 1
+                    if retry_at is not None:
+                        self._next_recheck = retry_at if self._next_recheck is None else min(self._next_recheck, retry_at)
+                    continue
+            
+            # Memos modified within min_age may still be recording (possibly paused),
+            # so they are left for a later pass instead of being processed half-finished
+            if min_age and time.time() - stat.st_mtime < min_age:
+                deferred += 1
+                recheck = stat.st_mtime + min_age
+                self._next_recheck = recheck if self._next_recheck is None else min(self._next_recheck, recheck)
+                continue
+            
+            # Otherwise fall back to the content hash (handles renamed or edited memos)
+            memo_file = Path(path)
+            try:
                 file_hash = self._get_file_hash(memo_file)
-                if file_hash not in self.processed_files:
-                    unprocessed.append(memo_file)
+            except FileNotFoundError:
+                # Deleted since it was listed (e.g. a missed watcher event)
+                voice_memos.pop(path, None)
+                continue
+            except Exception as e:
+                console.print(f"[yellow]Warning:[/yellow] Could not hash {memo_file.name}: {e}")
+                continue
+            if file_hash in self.processed_files:
+                self._source_index[source_key] = file_hash
+                self._index_dirty = True
+            else:
+                unprocessed.append((memo_file, file_hash, stat))
+        
+        if failed:
+            console.print(f"[dim]Skipping {failed} memo(s) that failed earlier in this session[/dim]")
+        if deferred:
+            console.print(f"[dim]Waiting for {deferred} memo(s) modified in the last {min_age:.0f}s to finish recording[/dim]")
+        self._save_processed_index()
         
         return unprocessed
     
     @abstractmethod
-    def transcribe_audio(self, audio_file: Path) -> str:
+    async def transcribe_audio(self, audio_file: Path) -> str:
         pass
     
     @abstractmethod
-    def generate_summary_and_title(self, transcription: str) -> Dict[str, str]:
+    async def generate_summary_and_title(self, transcription: str) -> Dict[str, str]:
+        pass
+    
+    async def generate_summary_and_title_batch(self, transcriptions: List[Tuple[str, str]]) -> Dict[str, Dict[str, str]]:
+        # Providers without a packed prompt summarize each transcription separately.
+        # This runs inside one summary worker, so the requests are made one at a
+        # time to keep SUMMARY_WORKERS as the limit on concurrent requests.
+        summaries = {}
+        for memo_id, transcription in transcriptions:
+            try:
+                summaries[memo_id] = await self.generate_summary_and_title(transcription)
+            except Exception as e:
+                console.print(f"[bold red]✗ Error summarizing {memo_id}: {e}[/bold red]")
+        return summaries
+    
+    async def close(self):
         pass
     
     def sanitize_filename(self, filename: str) -> str:
-        invalid_chars = '<>:"/\\|?*'
-        for char in invalid_chars:
-            filename = filename.replace(char, '')
-        filename = filename.strip()
+        filename = filename.translate(_SANITIZE_TABLE).strip()
         if not filename:
             filename = "untitled"
         return filename[:100]
     
-    def copy_audio_file(self, source_file: Path, filename_summary: str) -> Path:
+    def _unique_path(self, path: Path) -> Path:
+        # Concurrent memos can produce the same timestamp and name
+        candidate = path
+        counter = 1
+        while candidate.exists():
+            candidate = path.with_name(f"{path.stem}_{counter}{path.suffix}")
+            counter += 1
+        return candidate
+    
+    async def copy_audio_file(self, source_file: Path, filename_summary: str) -> Path:
         sanitized_name = self.sanitize_filename(filename_summary)
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         new_filename = f"{timestamp}_{sanitized_name}.m4a"
-        destination = self.config.attachments_path / new_filename
+        destination = self._unique_path(self.config.attachments_path / new_filename)
+        new_filename = destination.name
         
-        with console.status("[bold cyan]Copying audio file...", spinner="dots"):
-            shutil.copy2(source_file, destination)
+        await asyncio.to_thread(shutil.copy2, source_file, destination)
         
         console.print(f"  [green]✓[/green] Audio saved as: [italic]{new_filename}[/italic]")
         return destination
     
-    def create_obsidian_note(self, title: str, summary: str, transcription: str, 
-                           audio_file: Path, creation_date: datetime) -> Path:
+    def get_note_path(self, title: str, creation_date: datetime) -> Path:
         sanitized_title = self.sanitize_filename(title)
         timestamp = creation_date.strftime("%Y%m%d_%H%M%S")
         note_filename = f"{timestamp}_{sanitized_title}.md"
-        note_path = self.config.notes_path / note_filename
-        
+        return self._unique_path(self.config.notes_path / note_filename)
+    
+    async def create_obsidian_note(self, note_path: Path, title: str, summary: str, transcription: str, 
+                                   audio_file: Path, creation_date: datetime) -> Path:
         relative_audio_path = os.path.relpath(audio_file, self.config.obsidian_vault_path)
         
         note_content = f"""# {title}
@@ -180,65 +563,127 @@ class BaseMemoProcessor(ABC):
 *Generated automatically from voice memo*
 """
         
-        with console.status("[bold cyan]Creating note...", spinner="dots"):
-            with open(note_path, 'w', encoding='utf-8') as f:
-                f.write(note_content)
+        async with aiofiles.open(note_path, 'w', encoding='utf-8') as f:
+            await f.write(note_content)
         
-        console.print(f"  [green]✓[/green] Note created: [italic]{note_filename}[/italic]")
+        console.print(f"  [green]✓[/green] Note created: [italic]{note_path.name}[/italic]")
         return note_path
     
-    def update_daily_note(self, date: datetime, note_path: Path):
+    async def update_daily_note(self, date: datetime, note_path: Path):
         daily_note_filename = date.strftime("%Y-%m-%d.md")
         daily_note_path = self.config.diary_path / daily_note_filename
         
         relative_note_path = os.path.relpath(note_path, self.config.obsidian_vault_path)
         note_link = f"![[{relative_note_path.replace('.md', '')}]]"
         
-        with console.status("[bold cyan]Updating daily note...", spinner="dots"):
-            if daily_note_path.exists():
-                with open(daily_note_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                
-                if "## Voice Memos" not in content:
-                    content += "\n\n## Voice Memos\n"
+        # Links are appended rather than rewriting the whole note. Notes known to
+        # have the Voice Memos header are remembered so each is read at most once
+        # per pass, as long as the note has not been deleted in the meantime.
+        exists = daily_note_path.exists()
+        if exists and daily_note_path in self._daily_notes_with_header:
+            async with aiofiles.open(daily_note_path, 'a', encoding='utf-8') as f:
+                await f.write(f"{note_link}\n\n")
+            console.print(f"  [green]✓[/green] Updated daily note: [italic]{daily_note_filename}[/italic]")
+        elif exists:
+            async with aiofiles.open(daily_note_path, 'r', encoding='utf-8') as f:
+                content = await f.read()
+            
+            addition = ""
+            if "## Voice Memos" not in content:
+                addition += "\n\n## Voice Memos\n"
 
-                content += f"{note_link}\n\n"
+            addition += f"{note_link}\n\n"
 
-                with open(daily_note_path, 'w', encoding='utf-8') as f:
-                    f.write(content)
-                console.print(f"  [green]✓[/green] Updated daily note: [italic]{daily_note_filename}[/italic]")
-            else:
-                content = f"""# {date.strftime("%Y-%m-%d")}
+            async with aiofiles.open(daily_note_path, 'a', encoding='utf-8') as f:
+                await f.write(addition)
+            self._daily_notes_with_header.add(daily_note_path)
+            console.print(f"  [green]✓[/green] Updated daily note: [italic]{daily_note_filename}[/italic]")
+        else:
+            content = f"""# {date.strftime("%Y-%m-%d")}
 
 ## Voice Memos
 {note_link}
 """
-                with open(daily_note_path, 'w', encoding='utf-8') as f:
-                    f.write(content)
-                console.print(f"  [green]✓[/green] Created daily note: [italic]{daily_note_filename}[/italic]")
+            async with aiofiles.open(daily_note_path, 'w', encoding='utf-8') as f:
+                await f.write(content)
+            self._daily_notes_with_header.add(daily_note_path)
+            console.print(f"  [green]✓[/green] Created daily note: [italic]{daily_note_filename}[/italic]")
     
-    def get_file_creation_date(self, file_path: Path) -> datetime:
-        stat = file_path.stat()
+    def _creation_date_from_stat(self, stat: os.stat_result) -> datetime:
         return datetime.fromtimestamp(stat.st_birthtime if hasattr(stat, 'st_birthtime') else stat.st_mtime)
     
-    def process_memo(self, memo_file: Path, index: int, total: int):
-        panel = Panel(
-            f"[bold]Processing:[/bold] {memo_file.name}\n[dim]({index}/{total})[/dim]",
-            style="bright_blue",
-            expand=False
-        )
-        console.print(panel)
+    def get_file_creation_date(self, file_path: Path, stat: Optional[os.stat_result] = None) -> datetime:
+        # Callers that already have the stat (e.g. from scandir) can pass it to skip the syscall
+        return self._creation_date_from_stat(stat if stat is not None else file_path.stat())
+    
+    def _update_progress(self, job: MemoJob, status: str, advance: int = 0):
+        if self._progress is not None and job.task_id is not None:
+            self._progress.update(job.task_id, description=f"{job.memo_file.name} [dim]{status}[/dim]", advance=advance)
+    
+    def _remember_failure(self, job: MemoJob, retry: bool = True):
+        if self._failed_sources is None:
+            return
+        source_key = self._source_key(job.stat)
+        failures = self._failed_sources.get(source_key, (0, None))[0] + 1
+        retry_at = None
+        if retry:
+            retry_at = time.time() + min(WATCH_RETRY_INITIAL_DELAY * 2 ** (failures - 1), WATCH_RETRY_MAX_DELAY)
+        self._failed_sources[source_key] = (failures, retry_at)
+    
+    def _fail_memo(self, job: MemoJob, message: str):
+        console.print(f"[bold red]✗ Error processing {job.memo_file.name}: {message}[/bold red]")
+        self._update_progress(job, "[red]failed[/red]")
+        self._remember_failure(job)
+    
+    async def _transcribe_memo(self, job: MemoJob) -> Optional[MemoJob]:
+        self._update_progress(job, "transcribing")
+        try:
+            job.transcription = await self.transcribe_audio(job.memo_file)
+        except Exception as e:
+            self._fail_memo(job, str(e))
+            return None
         
+        if not job.transcription.strip():
+            console.print(f"[yellow]  ⚠ Empty transcription for {job.memo_file.name}, skipping...[/yellow]")
+            self._update_progress(job, "[yellow]empty, skipped[/yellow]")
+            self._remember_failure(job, retry=False)
+            return None
+        self._update_progress(job, "waiting for summary", advance=1)
+        return job
+    
+    def _apply_summaries(self, jobs: List[MemoJob], summaries: Dict[str, Dict[str, str]]) -> List[MemoJob]:
+        summarized = []
+        for job in jobs:
+            if job.memo_file.name not in summaries:
+                self._fail_memo(job, "no summary generated")
+                continue
+            job.summary_data = summaries[job.memo_file.name]
+            self._update_progress(job, "waiting to be written", advance=1)
+            summarized.append(job)
+        return summarized
+    
+    async def _summarize_memos(self, jobs: List[MemoJob]) -> List[MemoJob]:
+        for job in jobs:
+            self._update_progress(job, "summarizing")
+        
+        # Memo file names are unique within the folder, so they identify each transcription
         try:
-            creation_date = self.get_file_creation_date(memo_file)
-            
-            transcription = self.transcribe_audio(memo_file)
-            
-            if not transcription.strip():
-                console.print("[yellow]  ⚠ Empty transcription, skipping...[/yellow]")
-                return
-            
-            summary_data = self.generate_summary_and_title(transcription)
+            summaries = await self.generate_summary_and_title_batch(
+                [(job.memo_file.name, job.transcription) for job in jobs]
+            )
+        except Exception as e:
+            for job in jobs:
+                self._fail_memo(job, str(e))
+            return []
+        
+        return self._apply_summaries(jobs, summaries)
+    
+    async def _write_memo(self, job: MemoJob) -> Optional[MemoJob]:
+        memo_file = job.memo_file
+        summary_data = job.summary_data
+        self._update_progress(job, "writing")
+        try:
+            creation_date = self.get_file_creation_date(memo_file, job.stat)
             
             # Display summary info
             summary_table = Table(show_header=False, box=None, padding=(0, 1))
@@ -248,37 +693,174 @@ class BaseMemoProcessor(ABC):
             summary_table.add_row("Summary:", Text(summary_data.get("summary", "")[:100] + "...", style="italic"))
             console.print(summary_table)
             
-            copied_audio = self.copy_audio_file(
+            copied_audio = await self.copy_audio_file(
                 memo_file, 
                 summary_data.get("filename_summary", "memo")
             )
             
-            note_path = self.create_obsidian_note(
-                summary_data.get("title", "Voice Memo"),
+            title = summary_data.get("title", "Voice Memo")
+            note_path = self.get_note_path(title, creation_date)
+            
+            await self.create_obsidian_note(
+                note_path,
+                title,
                 summary_data.get("summary", ""),
-                transcription,
+                job.transcription,
                 copied_audio,
                 creation_date
             )
             
-            self.update_daily_note(creation_date, note_path)
+            # Only link the note from the daily note once it exists
+            await self.update_daily_note(creation_date, note_path)
             
-            # Add the hash to our in-memory set (for this session only)
-            file_hash = self._get_file_hash(memo_file)
-            self.processed_files.add(file_hash)
+            # Reuse the hash computed while filtering instead of reading the memo again
+            self._record_processed(job.stat, copied_audio, job.file_hash)
             
             console.print(f"[bold green]✓ Successfully processed {memo_file.name}[/bold green]\n")
+            self._update_progress(job, "[green]done[/green]", advance=1)
+            return job
             
         except Exception as e:
-            console.print(f"[bold red]✗ Error processing {memo_file.name}: {e}[/bold red]\n")
+            self._fail_memo(job, str(e))
+            return None
     
-    def process_all_memos(self):
+    async def _run_stage(self, workers: int, handler: Callable[..., Awaitable],
+                         in_queue: asyncio.Queue, out_queue: Optional[asyncio.Queue] = None,
+                         batch_size: Optional[int] = None) -> List[MemoJob]:
+        # A None item marks the end of the input; each worker puts it back for its siblings.
+        # With batch_size, the handler takes a list of whatever jobs are already
+        # queued (up to batch_size) instead of a single job, so batches only form
+        # when the stage is backed up and never delay an idle pipeline.
+        completed = []
+        
+        async def worker():
+            while (job := await in_queue.get()) is not None:
+                if batch_size is None:
+                    result = await handler(job)
+                    results = [result] if result is not None else []
+                else:
+                    jobs = [job]
+                    while len(jobs) < batch_size and not in_queue.empty():
+                        next_job = in_queue.get_nowait()
+                        if next_job is None:
+                            in_queue.put_nowait(None)
+                            break
+                        jobs.append(next_job)
+                    results = await handler(jobs)
+                
+                for result in results:
+                    if out_queue is not None:
+                        await out_queue.put(result)
+                    completed.append(result)
+            await in_queue.put(None)
+        
+        async with asyncio.TaskGroup() as tg:
+            for _ in range(workers):
+                tg.create_task(worker())
+        
+        if out_queue is not None:
+            await out_queue.put(None)
+        return completed
+    
+    async def _summarize_with_batch_api(self, jobs: List[MemoJob]) -> List[MemoJob]:
+        if not jobs:
+            return []
+        
+        for job in jobs:
+            self._update_progress(job, "waiting for batch")
+        
+        # Memo file names are unique within the folder, unlike content hashes
+        try:
+            summaries = await self.generate_summaries_with_batch_api(
+                {job.memo_file.name: job.transcription for job in jobs}
+            )
+        except Exception as e:
+            for job in jobs:
+                self._fail_memo(job, f"batch summary failed: {e}")
+            return []
+        
+        return self._apply_summaries(jobs, summaries)
+    
+    async def _run_pipeline(self, jobs: List[MemoJob], batch: bool) -> List[MemoJob]:
+        # Transcription and summarization run as separate stages so that one
+        # memo can be summarized while the next one is being transcribed.
+        # File I/O is done by a single writer to keep note updates ordered.
+        memo_queue: asyncio.Queue = asyncio.Queue()
+        transcript_queue: asyncio.Queue = asyncio.Queue()
+        summary_queue: asyncio.Queue = asyncio.Queue()
+        
+        for job in jobs:
+            memo_queue.put_nowait(job)
+        memo_queue.put_nowait(None)
+        
+        if batch:
+            # Audio transcription isn't available through the Batch API, so
+            # only the summaries are submitted as a batch job
+            transcribed = await self._run_stage(self.config.transcription_workers, self._transcribe_memo, memo_queue)
+            for job in await self._summarize_with_batch_api(transcribed):
+                summary_queue.put_nowait(job)
+            summary_queue.put_nowait(None)
+            return await self._run_stage(1, self._write_memo, summary_queue)
+        
+        async with asyncio.TaskGroup() as tg:
+            tg.create_task(self._run_stage(self.config.transcription_workers, self._transcribe_memo,
+                                           memo_queue, transcript_queue))
+            tg.create_task(self._run_stage(self.config.summary_workers, self._summarize_memos,
+                                           transcript_queue, summary_queue,
+                                           batch_size=self.config.summary_batch_size if self.packs_summaries else 1))
+            writer = tg.create_task(self._run_stage(1, self._write_memo, summary_queue))
+        
+        return writer.result()
+    
+    async def watch(self, batch: bool = False):
+        # Process the current backlog, then keep processing memos as they are recorded
+        loop = asyncio.get_running_loop()
+        changed = asyncio.Event()
+        self._failed_sources = {}
+        
+        def on_change(path: str):
+            if self._voice_memo_changed(path):
+                changed.set()
+        
+        observer = Observer()
+        observer.schedule(_VoiceMemoEventHandler(loop, on_change), str(self.config.voice_memos_path), recursive=False)
+        observer.start()
+        try:
+            self._list_voice_memos()
+            console.print(f"[cyan]Watching {self.config.voice_memos_path} for new memos (Ctrl+C to stop)...[/cyan]")
+            while True:
+                # One failed pass (e.g. an unwritable index) must not stop the watcher
+                try:
+                    await self.process_all_memos(batch=batch, min_age=self.config.watch_quiet_seconds)
+                except Exception as e:
+                    console.print(f"[bold red]✗ Error processing memos: {e}[/bold red]")
+                
+                # Wake up on the next change, or once a deferred memo has been quiet long enough
+                timeout = None if self._next_recheck is None else max(self._next_recheck - time.time(), 0) + 1
+                try:
+                    await asyncio.wait_for(changed.wait(), timeout=timeout)
+                except TimeoutError:
+                    continue
+                # Voice Memos writes recordings incrementally, so wait until the folder is quiet
+                while True:
+                    changed.clear()
+                    try:
+                        await asyncio.wait_for(changed.wait(), timeout=WATCH_SETTLE_SECONDS)
+                    except TimeoutError:
+                        break
+        finally:
+            observer.stop()
+            await asyncio.to_thread(observer.join)
+    
+    async def process_all_memos(self, batch: bool = False, min_age: float = 0):
         console.print(Panel.fit(
             "[bold cyan]Voice Memo Transcription to Obsidian[/bold cyan]",
             style="bright_blue"
         ))
         
-        unprocessed = self.get_unprocessed_memos()
+        # Hashing new memos and saving the index block, so they run off the event
+        # loop (in --watch mode the watcher callbacks keep being handled meanwhile)
+        unprocessed = await asyncio.to_thread(self.get_unprocessed_memos, min_age)
         
         if not unprocessed:
             console.print("[yellow]No new memos to process.[/yellow]")
@@ -286,14 +868,37 @@ class BaseMemoProcessor(ABC):
         
         console.print(f"\n[bold green]Found {len(unprocessed)} unprocessed memo(s)[/bold green]\n")
         
-        for index, memo_file in enumerate(unprocessed, 1):
-            self.process_memo(memo_file, index, len(unprocessed))
+        # Daily notes may have been edited or removed since the last --watch pass
+        self._daily_notes_with_header.clear()
+        
+        # A single progress display tracks every memo; Rich can only show one
+        # live display at a time, so per-operation spinners don't work concurrently
+        self._progress = Progress(
+            SpinnerColumn(),
+            TextColumn("{task.description}"),
+            BarColumn(),
+            TimeElapsedColumn(),
+            console=console
+        )
+        jobs = []
+        for memo_file, file_hash, stat in unprocessed:
+            job = MemoJob(memo_file, file_hash, stat)
+            job.task_id = self._progress.add_task(f"{memo_file.name} [dim]queued[/dim]", total=3)
+            jobs.append(job)
+        
+        try:
+            with self._progress:
+                processed = await self._run_pipeline(jobs, batch)
+        finally:
+            self._progress = None
+        
+        await asyncio.to_thread(self._save_processed_index)
         
         # Summary table
         summary = Table(title="Processing Complete", style="green")
         summary.add_column("Metric", style="cyan")
         summary.add_column("Value", style="bold")
-        summary.add_row("Memos Processed", str(len(unprocessed)))
+        summary.add_row("Memos Processed", f"{len(processed)}/{len(unprocessed)}")
         summary.add_row("Total Existing Files", str(len(self.processed_files)))
         
         console.print("\n")
@@ -301,37 +906,49 @@ class BaseMemoProcessor(ABC):
 
 
 class OpenAIMemoProcessor(BaseMemoProcessor):
+    supports_batch_api = True
+    packs_summaries = True
+    
     def __init__(self, config: Config):
         super().__init__(config)
-        self.client = OpenAI(api_key=config.openai_api_key)
+        # AsyncOpenAI already pools connections; this enables HTTP/2 so concurrent
+        # requests multiplex over a few connections, and sizes the pool explicitly
+        http_client = DefaultAsyncHttpxClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=32)
+        )
+        # Retries are left to openai_retry so every attempt goes through the rate
+        # limiter and its backoff, instead of the SDK retrying underneath it
+        self.client = AsyncOpenAI(api_key=config.openai_api_key, http_client=http_client, max_retries=0)
+        # Loaded up front: the first load downloads and builds the BPE ranks, which
+        # would otherwise block the event loop in the middle of a run
+        self._encoding = _load_encoding(config.chat_model)
     
-    def transcribe_audio(self, audio_file: Path) -> str:
-        with console.status(f"[bold blue]Transcribing {audio_file.name} with OpenAI...[/bold blue]", spinner="dots"):
-            try:
-                with open(audio_file, "rb") as f:
-                    transcript = self.client.audio.transcriptions.create(
-                        model=self.config.whisper_model,
-                        file=f,
-                        response_format="text"
-                    )
-                return transcript
-            except Exception as e:
-                console.print(f"[red]Error transcribing {audio_file.name}: {e}[/red]")
-                raise
+    async def close(self):
+        await self.client.close()
     
-    def generate_summary_and_title(self, transcription: str) -> Dict[str, str]:
-        with console.status("[bold blue]Generating summary and title with OpenAI...[/bold blue]", spinner="dots"):
-            try:
-                response = self.client.chat.completions.create(
-                    model=self.config.chat_model,
-                    messages=[
-                        {
-                            "role": "system",
-                            "content": "You are a helpful assistant that creates concise summaries and titles for voice memos."
-                        },
-                        {
-                            "role": "user",
-                            "content": f"""Based on this transcription, provide:
+    @openai_retry
+    async def transcribe_audio(self, audio_file: Path) -> str:
+        # Read the memo once (it is usually still in the page cache from hashing)
+        # and upload the bytes, rather than having the client read a blocking file
+        async with aiofiles.open(audio_file, "rb") as f:
+            audio_data = await f.read()
+        
+        await self.rate_limiter.acquire()
+        transcript = await self.client.audio.transcriptions.create(
+            model=self.config.whisper_model,
+            file=(audio_file.name, audio_data, "audio/m4a"),
+            response_format="text"
+        )
+        return transcript
+    
+    def _count_tokens(self, text: str) -> int:
+        if self._encoding is None:
+            return _estimate_tokens(text)
+        return len(self._encoding.encode(text))
+    
+    def _summary_request(self, transcription: str) -> Dict:
+        prompt = f"""Based on this transcription, provide:
 1. A one-line summary (max 50 characters, suitable for a filename)
 2. A longer summary (2-3 sentences)
 3. A title for the note
@@ -340,19 +957,170 @@ Transcription:
 {transcription}
 
 Please respond in JSON format with keys: "filename_summary", "summary", "title"."""
-                        }
-                    ],
-                    response_format={ "type": "json_object" }
-                )
-                
-                content = response.choices[0].message.content
-                if content is None:
-                    raise ValueError("No content in API response")
-                result = json.loads(content)
-                return result
-            except Exception as e:
-                console.print(f"[red]Error generating summary: {e}[/red]")
-                raise
+        return self._chat_request(prompt)
+    
+    def _chat_request(self, prompt: str) -> Dict:
+        return {
+            "model": self.config.chat_model,
+            "messages": [
+                {
+                    "role": "system",
+                    "content": "You are a helpful assistant that creates concise summaries and titles for voice memos."
+                },
+                {
+                    "role": "user",
+                    "content": prompt
+                }
+            ],
+            "response_format": { "type": "json_object" }
+        }
+    
+    @openai_retry
+    async def generate_summary_and_title(self, transcription: str) -> Dict[str, str]:
+        request = self._summary_request(transcription)
+        await self.rate_limiter.acquire(self._count_tokens(request["messages"][-1]["content"]))
+        response = await self.client.chat.completions.create(**request)
+        
+        content = response.choices[0].message.content
+        if content is None:
+            raise ValueError("No content in API response")
+        result = _json_loads(content)
+        return result
+    
+    def _chunk_by_tokens(self, transcriptions: List[Tuple[str, str]]) -> List[List[Tuple[str, str]]]:
+        chunks = []
+        current: List[Tuple[str, str]] = []
+        current_tokens = 0
+        for memo_id, transcription in transcriptions:
+            tokens = self._count_tokens(transcription)
+            if current and current_tokens + tokens > self.config.summary_batch_max_tokens:
+                chunks.append(current)
+                current, current_tokens = [], 0
+            current.append((memo_id, transcription))
+            current_tokens += tokens
+        if current:
+            chunks.append(current)
+        return chunks
+    
+    @openai_retry
+    async def _generate_packed_summaries(self, transcriptions: List[Tuple[str, str]]) -> Dict[str, Dict[str, str]]:
+        sections = "\n\n".join(
+            f'<transcription id="{memo_id}">\n{transcription}\n</transcription>'
+            for memo_id, transcription in transcriptions
+        )
+        prompt = f"""For each of the following transcriptions, provide:
+1. A one-line summary (max 50 characters, suitable for a filename)
+2. A longer summary (2-3 sentences)
+3. A title for the note
+
+{sections}
+
+Please respond in JSON format with an object mapping each transcription id to an object with keys: "filename_summary", "summary", "title"."""
+        
+        await self.rate_limiter.acquire(self._count_tokens(prompt))
+        response = await self.client.chat.completions.create(**self._chat_request(prompt))
+        
+        content = response.choices[0].message.content
+        if content is None:
+            raise ValueError("No content in API response")
+        result = _json_loads(content)
+        return {memo_id: result[memo_id] for memo_id, _ in transcriptions if isinstance(result.get(memo_id), dict)}
+    
+    async def generate_summary_and_title_batch(self, transcriptions: List[Tuple[str, str]]) -> Dict[str, Dict[str, str]]:
+        # Pack several transcriptions into one request so the round trip and the
+        # system prompt are shared, keeping each request within the token budget.
+        # Chunks are sent one after another, like the rest of a worker's requests.
+        async def summarize_chunk(chunk: List[Tuple[str, str]]) -> Dict[str, Dict[str, str]]:
+            summaries = {}
+            if len(chunk) > 1:
+                try:
+                    summaries = await self._generate_packed_summaries(chunk)
+                except Exception as e:
+                    console.print(f"[yellow]Warning:[/yellow] Packed summary request failed, summarizing individually: {e}")
+            # Anything the packed response left out is summarized on its own
+            missing = [(memo_id, transcription) for memo_id, transcription in chunk if memo_id not in summaries]
+            summaries.update(await super(OpenAIMemoProcessor, self).generate_summary_and_title_batch(missing))
+            return summaries
+        
+        results = {}
+        for chunk in self._chunk_by_tokens(transcriptions):
+            results.update(await summarize_chunk(chunk))
+        return results
+    
+    async def generate_summaries_with_batch_api(self, transcriptions: Dict[str, str]) -> Dict[str, Dict[str, str]]:
+        lines = [
+            json.dumps({
+                "custom_id": custom_id,
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": self._summary_request(transcription)
+            })
+            for custom_id, transcription in transcriptions.items()
+        ]
+        
+        # The client does not retry on its own, so each Batch API call gets the same
+        # backoff as the other requests
+        input_file = await openai_retry(self.client.files.create)(
+            file=("summaries.jsonl", "\n".join(lines).encode("utf-8")),
+            purpose="batch"
+        )
+        batch = await openai_retry(self.client.batches.create)(
+            input_file_id=input_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        console.print(f"[cyan]Submitted batch {batch.id} with {len(lines)} summary request(s), waiting for results...[/cyan]")
+        
+        # Batches can take up to 24h, so back off between polls
+        delay = BATCH_POLL_INITIAL_DELAY
+        while batch.status not in ("completed", "failed", "expired", "cancelled"):
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, BATCH_POLL_MAX_DELAY)
+            batch = await openai_retry(self.client.batches.retrieve)(batch.id)
+        
+        if batch.status != "completed":
+            raise RuntimeError(f"Batch {batch.id} finished with status '{batch.status}'")
+        if not batch.output_file_id and not batch.error_file_id:
+            raise RuntimeError(f"Batch {batch.id} produced no output")
+        
+        results = {}
+        if batch.output_file_id:
+            output = await openai_retry(self.client.files.content)(batch.output_file_id)
+            for line in output.text.splitlines():
+                if not line.strip():
+                    continue
+                # One malformed result must not discard the rest of the batch; memos
+                # without a result fail on their own in _apply_summaries
+                try:
+                    record = _json_loads(line)
+                    custom_id = record["custom_id"]
+                    response = record.get("response") or {}
+                    if response.get("status_code") != 200:
+                        console.print(f"[yellow]Warning:[/yellow] Batch request {custom_id} failed: {_batch_error(record)}")
+                        continue
+                    content = response["body"]["choices"][0]["message"]["content"]
+                    if content is None:
+                        raise ValueError("No content in API response")
+                    results[custom_id] = _json_loads(content)
+                except (KeyError, IndexError, TypeError, ValueError) as e:
+                    console.print(f"[yellow]Warning:[/yellow] Skipping unreadable batch result: {e}")
+        
+        # Requests that failed outright are only listed in the error file
+        if batch.error_file_id:
+            errors = await openai_retry(self.client.files.content)(batch.error_file_id)
+            failed = 0
+            for line in errors.text.splitlines():
+                if not line.strip():
+                    continue
+                failed += 1
+                try:
+                    record = _json_loads(line)
+                    console.print(f"[yellow]Warning:[/yellow] Batch request {record['custom_id']} failed: {_batch_error(record)}")
+                except (KeyError, TypeError, ValueError) as e:
+                    console.print(f"[yellow]Warning:[/yellow] Skipping unreadable batch error: {e}")
+            if failed:
+                console.print(f"[yellow]Warning:[/yellow] {failed} request(s) in batch {batch.id} failed")
+        return results
 
 
 class GeminiMemoProcessor(BaseMemoProcessor):
@@ -361,36 +1129,29 @@ class GeminiMemoProcessor(BaseMemoProcessor):
         genai.configure(api_key=config.gemini_api_key)
         self.model = genai.GenerativeModel(config.gemini_model)
     
-    def transcribe_audio(self, audio_file: Path) -> str:
-        with console.status(f"[bold blue]Transcribing {audio_file.name} with Gemini...[/bold blue]", spinner="dots"):
-            try:
-                # Upload the audio file to Gemini
-                with open(audio_file, "rb") as f:
-                    audio_data = f.read()
-                
-                # Create a temporary file object for Gemini
-                uploaded_file = genai.upload_file(str(audio_file), mime_type="audio/m4a")
-                
-                # Generate transcription using Gemini
-                prompt = "Please transcribe this audio file. Provide only the transcription text, nothing else."
-                response = self.model.generate_content([prompt, uploaded_file])
-                
-                # Clean up uploaded file
-                uploaded_file.delete()
-                
-                if response.text:
-                    return response.text.strip()
-                else:
-                    raise ValueError("No transcription generated")
-                    
-            except Exception as e:
-                console.print(f"[red]Error transcribing {audio_file.name}: {e}[/red]")
-                raise
+    @gemini_retry
+    async def transcribe_audio(self, audio_file: Path) -> str:
+        # Upload the audio file to Gemini (the SDK upload is blocking)
+        uploaded_file = await asyncio.to_thread(genai.upload_file, str(audio_file), mime_type="audio/m4a")
+        
+        try:
+            # Generate transcription using Gemini
+            prompt = "Please transcribe this audio file. Provide only the transcription text, nothing else."
+            await self.rate_limiter.acquire()
+            response = await self.model.generate_content_async([prompt, uploaded_file])
+        finally:
+            # Clean up uploaded file, also when the request fails and is retried
+            await asyncio.to_thread(uploaded_file.delete)
+        
+        if response.text:
+            return response.text.strip()
+        else:
+            raise ValueError("No transcription generated")
     
-    def generate_summary_and_title(self, transcription: str) -> Dict[str, str]:
-        with console.status("[bold blue]Generating summary and title with Gemini...[/bold blue]", spinner="dots"):
-            try:
-                prompt = f"""Based on this transcription, provide:
+    @gemini_retry
+    async def generate_summary_and_title(self, transcription: str) -> Dict[str, str]:
+        try:
+            prompt = f"""Based on this transcription, provide:
 1. A one-line summary (max 50 characters, suitable for a filename)
 2. A longer summary (2-3 sentences)
 3. A title for the note
@@ -402,49 +1163,76 @@ Please respond ONLY with valid JSON format with keys: "filename_summary", "summa
 Example response:
 {{"filename_summary": "Meeting notes about project", "summary": "Discussion about project timeline and deliverables.", "title": "Project Meeting Notes"}}"""
 
-                response = self.model.generate_content(
-                    prompt,
-                    generation_config=genai.GenerationConfig(
-                        temperature=0.3,
-                        response_mime_type="application/json"
-                    )
+            await self.rate_limiter.acquire(_estimate_tokens(prompt))
+            response = await self.model.generate_content_async(
+                prompt,
+                generation_config=genai.GenerationConfig(
+                    temperature=0.3,
+                    response_mime_type="application/json"
                 )
+            )
+            
+            if response.text:
+                result = _json_loads(response.text)
+                return result
+            else:
+                raise ValueError("No summary generated")
                 
-                if response.text:
-                    result = json.loads(response.text)
-                    return result
-                else:
-                    raise ValueError("No summary generated")
-                    
-            except json.JSONDecodeError as e:
-                console.print(f"[red]Error parsing JSON response: {e}[/red]")
-                console.print(f"[yellow]Raw response: {response.text}[/yellow]")
-                # Fallback: try to extract without JSON
-                return {
-                    "filename_summary": "voice_memo",
-                    "summary": transcription[:100] + "...",
-                    "title": "Voice Memo"
-                }
-            except Exception as e:
-                console.print(f"[red]Error generating summary: {e}[/red]")
-                raise
+        except json.JSONDecodeError as e:
+            console.print(f"[red]Error parsing JSON response: {e}[/red]")
+            console.print(f"[yellow]Raw response: {response.text}[/yellow]")
+            # Fallback: try to extract without JSON
+            return {
+                "filename_summary": "voice_memo",
+                "summary": transcription[:100] + "...",
+                "title": "Voice Memo"
+            }
+
+
+async def run(processor: BaseMemoProcessor, batch: bool = False, watch: bool = False):
+    try:
+        if watch:
+            await processor.watch(batch=batch)
+        else:
+            await processor.process_all_memos(batch=batch)
+    finally:
+        await processor.close()
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Transcribe Apple Voice Memos into an Obsidian vault")
+    parser.add_argument("--batch", action="store_true",
+                        help="Generate summaries through the OpenAI Batch API (cheaper, results within 24h)")
+    parser.add_argument("--watch", action="store_true",
+                        help="Keep running and process new memos as they are recorded")
+    args = parser.parse_args()
+    
     try:
         config = Config()
         
+        if args.watch and Observer is None:
+            raise ValueError("--watch requires the watchdog package (pip install -e \".[watch]\")")
+        
         # Select the appropriate processor based on API provider
         if config.api_provider == "openai":
-            processor = OpenAIMemoProcessor(config)
-            console.print(f"[cyan]Using OpenAI API (Whisper + {config.chat_model})[/cyan]")
+            processor_class = OpenAIMemoProcessor
+            description = f"OpenAI API (Whisper + {config.chat_model})"
         elif config.api_provider == "gemini":
-            processor = GeminiMemoProcessor(config)
-            console.print(f"[cyan]Using Gemini API ({config.gemini_model})[/cyan]")
+            processor_class = GeminiMemoProcessor
+            description = f"Gemini API ({config.gemini_model})"
         else:
             raise ValueError(f"Unknown API provider: {config.api_provider}")
         
-        processor.process_all_memos()
+        if args.batch and not processor_class.supports_batch_api:
+            raise ValueError(f"--batch is not supported with API_PROVIDER={config.api_provider}")
+        # A batch can take up to 24h, during which a watch pass would pick up no new memos
+        if args.batch and args.watch:
+            raise ValueError("--batch cannot be combined with --watch")
+        
+        processor = processor_class(config)
+        console.print(f"[cyan]Using {description}[/cyan]")
+        
+        asyncio.run(run(processor, batch=args.batch, watch=args.watch))
     except ValueError as e:
         console.print(f"[bold red]Configuration error:[/bold red] {e}")
         console.print("\n[yellow]Please ensure the following environment variables are set:[/yellow]")
@@ -461,6 +1249,13 @@ def main():
         console.print("  • OBSIDIAN_DIARY_FOLDER (optional)")
         console.print("  • OBSIDIAN_NOTES_FOLDER (optional)")
         console.print("  • PROCESS_FILES_AFTER_DATE (optional, format: YYYY-MM-DD)")
+        console.print("  • TRANSCRIPTION_WORKERS (optional, default: 8)")
+        console.print("  • SUMMARY_WORKERS (optional, default: 8)")
+        console.print("  • SUMMARY_BATCH_SIZE (optional, default: 10)")
+        console.print("  • SUMMARY_BATCH_MAX_TOKENS (optional, default: 8000)")
+        console.print("  • MAX_REQUESTS_PER_MINUTE (optional, default: 500)")
+        console.print("  • MAX_TOKENS_PER_MINUTE (optional, default: 200000)")
+        console.print("  • WATCH_QUIET_SECONDS (optional, default: 120)")
     except KeyboardInterrupt:
         console.print("\n[yellow]Process interrupted by user[/yellow]")
     except Exception as e: